@@ -25,6 +25,7 @@ Generate TLSv1.3 Compat test cases
 import sys
 import os
 import argparse
+import functools
 import itertools
 from collections import namedtuple
 
@@ -46,6 +47,30 @@ CERTIFICATES = {
                                        )
 }
 
+
+def _certificate_args(template):
+    """
+    Format `template` with the certificate files of each signature algorithm.
+
+    The result maps each key of CERTIFICATES to its command line fragment.
+    """
+    return {sig_alg: template.format(cafile=certificate.cafile,
+                                     certfile=certificate.certfile,
+                                     keyfile=certificate.keyfile)
+            for sig_alg, certificate in CERTIFICATES.items()}
+
+
+# Command line fragments selecting the certificates, built once at load time
+_OPENSSL_CERT_FRAG = _certificate_args('-cert {certfile} -key {keyfile}')
+_OPENSSL_CAFILE_FRAG = _certificate_args('-CAfile {cafile}')
+_GNUTLS_CERT_FRAG = _certificate_args('--x509certfile {certfile} --x509keyfile {keyfile}')
+_GNUTLS_CAFILE_FRAG = _certificate_args('--x509cafile {cafile}')
+_MBEDTLS_CERT_FRAG = _certificate_args('crt_file={certfile} key_file={keyfile}')
+_MBEDTLS_CAFILE_FRAG = _certificate_args('ca_file={cafile}')
+
+# Certificates used when a program is not given any
+_ALL_CERT_SIG_ALGS = tuple(CERTIFICATES.keys())
+
 CIPHER_SUITE_IANA_VALUE = {
     "TLS_AES_128_GCM_SHA256": 0x1301,
     "TLS_AES_256_GCM_SHA384": 0x1302,
@@ -70,18 +95,50 @@ NAMED_GROUP_IANA_VALUE = {
 }
 
 
+def _memoize(method):
+    """
+    Memoize a TLSProgram method on its arguments, per program object.
+
+    Program objects are shared by the test cases that use the same
+    configuration (see get_program()), so each result is only built once.
+    The cache is cleared when the configuration of the program changes.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        # Key on the function, not its name: overrides call the base method
+        # through super() on the same object.
+        key = (method, args)
+        cache = self._cache  # pylint: disable=protected-access
+        if key not in cache:
+            cache[key] = tuple(method(self, *args))
+        return cache[key]
+    return wrapper
+
+
 class TLSProgram:
     """
     Base class for generate server/client command.
+
+    cmd() and the check methods return tuples of strings.
     """
 
     # pylint: disable=too-many-arguments
     def __init__(self, ciphersuite=None, signature_algorithm=None, named_group=None,
                  cert_sig_alg=None, compat_mode=True):
+        # Results of the methods decorated with _memoize
+        self._cache = {}
         self._ciphers = []
         self._sig_algs = []
         self._named_groups = []
         self._cert_sig_algs = []
+        # Sets mirroring the lists above, used to deduplicate in O(1)
+        self._ciphers_set = set()
+        self._sig_algs_set = set()
+        self._named_groups_set = set()
+        self._cert_sig_algs_set = set()
+        # Union of signature algorithms and certificate signature algorithms
+        self._merged_sig_algs = []
+        self._merged_sig_algs_set = set()
         if ciphersuite:
             self.add_ciphersuites(ciphersuite)
         if named_group:
@@ -92,39 +149,51 @@ class TLSProgram:
             self.add_cert_signature_algorithms(cert_sig_alg)
         self._compat_mode = compat_mode
 
+    def _extend_unique(self, items, seen, new_items):
+        for item in new_items:
+            if item not in seen:
+                seen.add(item)
+                items.append(item)
+                self._cache.clear()
+
     # add_ciphersuites should not override by sub class
     def add_ciphersuites(self, *ciphersuites):
-        self._ciphers.extend(
-            [cipher for cipher in ciphersuites if cipher not in self._ciphers])
+        self._extend_unique(self._ciphers, self._ciphers_set, ciphersuites)
 
     # add_signature_algorithms should not override by sub class
     def add_signature_algorithms(self, *signature_algorithms):
-        self._sig_algs.extend(
-            [sig_alg for sig_alg in signature_algorithms if sig_alg not in self._sig_algs])
+        self._extend_unique(self._sig_algs, self._sig_algs_set, signature_algorithms)
+        self._extend_unique(self._merged_sig_algs, self._merged_sig_algs_set,
+                            signature_algorithms)
 
     # add_named_groups should not override by sub class
     def add_named_groups(self, *named_groups):
-        self._named_groups.extend(
-            [named_group for named_group in named_groups if named_group not in self._named_groups])
+        self._extend_unique(self._named_groups, self._named_groups_set, named_groups)
 
     # add_cert_signature_algorithms should not override by sub class
     def add_cert_signature_algorithms(self, *signature_algorithms):
-        self._cert_sig_algs.extend(
-            [sig_alg for sig_alg in signature_algorithms if sig_alg not in self._cert_sig_algs])
+        self._extend_unique(self._cert_sig_algs, self._cert_sig_algs_set,
+                            signature_algorithms)
+        self._extend_unique(self._merged_sig_algs, self._merged_sig_algs_set,
+                            signature_algorithms)
+
+    def apply_defaults(self):
+        """Use all certificates if none was selected."""
+        if not self._cert_sig_algs:
+            self.add_cert_signature_algorithms(*_ALL_CERT_SIG_ALGS)
 
     # pylint: disable=no-self-use
     def pre_checks(self):
-        return []
+        return ()
 
     # pylint: disable=no-self-use
     def cmd(self):
-        if not self._cert_sig_algs:
-            self._cert_sig_algs = list(CERTIFICATES.keys())
-        return self.pre_cmd()
+        self.apply_defaults()
+        return tuple(self.pre_cmd())
 
     # pylint: disable=no-self-use
     def post_checks(self):
-        return []
+        return ()
 
     # pylint: disable=no-self-use
     def pre_cmd(self):
@@ -132,7 +201,10 @@ class TLSProgram:
 
     # pylint: disable=unused-argument,no-self-use
     def hrr_post_checks(self, named_group):
-        return []
+        return ()
+
+
+_OPENSSL_PRE_CHECKS = ("requires_openssl_tls1_3",)
 
 
 class OpenSSLBase(TLSProgram):
@@ -148,32 +220,31 @@ class OpenSSLBase(TLSProgram):
         'x448': 'X448',
     }
 
+    @_memoize
     def cmd(self):
-        ret = super().cmd()
+        ret = list(super().cmd())
 
         if self._ciphers:
             ciphersuites = ':'.join(self._ciphers)
-            ret += ["-ciphersuites {ciphersuites}".format(ciphersuites=ciphersuites)]
+            ret.append(f'-ciphersuites {ciphersuites}')
 
         if self._sig_algs:
-            signature_algorithms = set(self._sig_algs + self._cert_sig_algs)
-            signature_algorithms = ':'.join(signature_algorithms)
-            ret += ["-sigalgs {signature_algorithms}".format(
-                signature_algorithms=signature_algorithms)]
+            signature_algorithms = ':'.join(self._merged_sig_algs)
+            ret.append(f'-sigalgs {signature_algorithms}')
 
         if self._named_groups:
             named_groups = ':'.join(
                 map(lambda named_group: self.NAMED_GROUP[named_group], self._named_groups))
-            ret += ["-groups {named_groups}".format(named_groups=named_groups)]
+            ret.append(f'-groups {named_groups}')
 
-        ret += ['-msg -tls1_3']
+        ret.append('-msg -tls1_3')
         if not self._compat_mode:
-            ret += ['-no_middlebox']
+            ret.append('-no_middlebox')
 
         return ret
 
     def pre_checks(self):
-        return ["requires_openssl_tls1_3"]
+        return _OPENSSL_PRE_CHECKS
 
 
 class OpenSSLServ(OpenSSLBase):
@@ -181,18 +252,19 @@ class OpenSSLServ(OpenSSLBase):
     Generate test commands for OpenSSL server.
     """
 
+    @_memoize
     def cmd(self):
-        ret = super().cmd()
-        ret += ['-num_tickets 0 -no_resume_ephemeral -no_cache']
+        ret = list(super().cmd())
+        ret.append('-num_tickets 0 -no_resume_ephemeral -no_cache')
         return ret
 
+    @_memoize
     def post_checks(self):
         return ['-c "HTTP/1.0 200 ok"']
 
     def pre_cmd(self):
         ret = ['$O_NEXT_SRV_NO_CERT']
-        for _, cert, key in map(lambda sig_alg: CERTIFICATES[sig_alg], self._cert_sig_algs):
-            ret += ['-cert {cert} -key {key}'.format(cert=cert, key=key)]
+        ret += [_OPENSSL_CERT_FRAG[sig_alg] for sig_alg in self._cert_sig_algs]
         return ret
 
 
@@ -203,7 +275,12 @@ class OpenSSLCli(OpenSSLBase):
 
     def pre_cmd(self):
         return ['$O_NEXT_CLI_NO_CERT',
-                '-CAfile {cafile}'.format(cafile=CERTIFICATES[self._cert_sig_algs[0]].cafile)]
+                _OPENSSL_CAFILE_FRAG[self._cert_sig_algs[0]]]
+
+
+_GNUTLS_PRE_CHECKS = ("requires_gnutls_tls1_3",
+                      "requires_gnutls_next_no_ticket",
+                      "requires_gnutls_next_disable_tls13_compat")
 
 
 class GnuTLSBase(TLSProgram):
@@ -248,19 +325,20 @@ class GnuTLSBase(TLSProgram):
     }
 
     def pre_checks(self):
-        return ["requires_gnutls_tls1_3",
-                "requires_gnutls_next_no_ticket",
-                "requires_gnutls_next_disable_tls13_compat", ]
+        return _GNUTLS_PRE_CHECKS
 
+    @_memoize
     def cmd(self):
-        ret = super().cmd()
+        ret = list(super().cmd())
 
         priority_string_list = []
+        priority_string_set = set()
 
         def update_priority_string_list(items, map_table):
             for item in items:
                 for i in map_table[item]:
-                    if i not in priority_string_list:
+                    if i not in priority_string_set:
+                        priority_string_set.add(i)
                         yield i
 
         if self._ciphers:
@@ -270,9 +348,8 @@ class GnuTLSBase(TLSProgram):
             priority_string_list.extend(['CIPHER-ALL', 'MAC-ALL'])
 
         if self._sig_algs:
-            signature_algorithms = set(self._sig_algs + self._cert_sig_algs)
             priority_string_list.extend(update_priority_string_list(
-                signature_algorithms, self.SIGNATURE_ALGORITHM))
+                self._merged_sig_algs, self.SIGNATURE_ALGORITHM))
         else:
             priority_string_list.append('SIGN-ALL')
 
@@ -290,10 +367,9 @@ class GnuTLSBase(TLSProgram):
         priority_string += ':%NO_TICKETS'
 
         if not self._compat_mode:
-            priority_string += [':%DISABLE_TLS13_COMPAT_MODE']
+            priority_string += ':%DISABLE_TLS13_COMPAT_MODE'
 
-        ret += ['--priority={priority_string}'.format(
-            priority_string=priority_string)]
+        ret.append(f'--priority={priority_string}')
         return ret
 
 class GnuTLSServ(GnuTLSBase):
@@ -304,11 +380,10 @@ class GnuTLSServ(GnuTLSBase):
     def pre_cmd(self):
         ret = ['$G_NEXT_SRV_NO_CERT', '--http', '--disable-client-cert', '--debug=4']
 
-        for _, cert, key in map(lambda sig_alg: CERTIFICATES[sig_alg], self._cert_sig_algs):
-            ret += ['--x509certfile {cert} --x509keyfile {key}'.format(
-                cert=cert, key=key)]
+        ret += [_GNUTLS_CERT_FRAG[sig_alg] for sig_alg in self._cert_sig_algs]
         return ret
 
+    @_memoize
     def post_checks(self):
         return ['-c "HTTP/1.0 200 OK"']
 
@@ -320,7 +395,21 @@ class GnuTLSCli(GnuTLSBase):
 
     def pre_cmd(self):
         return ['$G_NEXT_CLI_NO_CERT', '--debug=4', '--single-key-share',
-                '--x509cafile {cafile}'.format(cafile=CERTIFICATES[self._cert_sig_algs[0]].cafile)]
+                _GNUTLS_CAFILE_FRAG[self._cert_sig_algs[0]]]
+
+
+@functools.lru_cache(maxsize=None)
+def _mbedtls_pre_checks(compat_mode, rsa_pss):
+    """Return the configuration requirements common to mbedTLS programs."""
+    ret = ('requires_config_enabled MBEDTLS_DEBUG_C',
+           'requires_config_enabled MBEDTLS_SSL_TLS1_3_KEY_EXCHANGE_MODE_EPHEMERAL_ENABLED')
+
+    if compat_mode:
+        ret += ('requires_config_enabled MBEDTLS_SSL_TLS1_3_COMPATIBILITY_MODE',)
+
+    if rsa_pss:
+        ret += ('requires_config_enabled MBEDTLS_X509_RSASSA_PSS_SUPPORT',)
+    return ret
 
 
 class MbedTLSBase(TLSProgram):
@@ -335,37 +424,59 @@ class MbedTLSBase(TLSProgram):
         'TLS_AES_128_CCM_SHA256': 'TLS1-3-AES-128-CCM-SHA256',
         'TLS_AES_128_CCM_8_SHA256': 'TLS1-3-AES-128-CCM-8-SHA256'}
 
+    @_memoize
     def cmd(self):
-        ret = super().cmd()
-        ret += ['debug_level=4']
+        ret = list(super().cmd())
+        ret.append('debug_level=4')
 
 
         if self._ciphers:
             ciphers = ','.join(
                 map(lambda cipher: self.CIPHER_SUITE[cipher], self._ciphers))
-            ret += ["force_ciphersuite={ciphers}".format(ciphers=ciphers)]
+            ret.append(f'force_ciphersuite={ciphers}')
 
-        if self._sig_algs + self._cert_sig_algs:
-            ret += ['sig_algs={sig_algs}'.format(
-                sig_algs=','.join(set(self._sig_algs + self._cert_sig_algs)))]
+        if self._merged_sig_algs:
+            sig_algs = ','.join(self._merged_sig_algs)
+            ret.append(f'sig_algs={sig_algs}')
 
         if self._named_groups:
             named_groups = ','.join(self._named_groups)
-            ret += ["curves={named_groups}".format(named_groups=named_groups)]
-        ret += ['force_version=tls13']
+            ret.append(f'curves={named_groups}')
+        ret.append('force_version=tls13')
         return ret
 
     def pre_checks(self):
-        ret = ['requires_config_enabled MBEDTLS_DEBUG_C',
-               'requires_config_enabled MBEDTLS_SSL_TLS1_3_KEY_EXCHANGE_MODE_EPHEMERAL_ENABLED']
-
-        if self._compat_mode:
-            ret += ['requires_config_enabled MBEDTLS_SSL_TLS1_3_COMPATIBILITY_MODE']
-
-        if 'rsa_pss_rsae_sha256' in self._sig_algs + self._cert_sig_algs:
-            ret.append(
-                'requires_config_enabled MBEDTLS_X509_RSASSA_PSS_SUPPORT')
-        return ret
+        return _mbedtls_pre_checks(self._compat_mode,
+                                   'rsa_pss_rsae_sha256' in self._merged_sig_algs_set)
+
+
+# Post checks of mbedTLS programs, built once at load time
+_MBEDTLS_SRV_CIPHER_CHECK = {
+    cipher: f'-s "server hello, chosen ciphersuite: {MbedTLSBase.CIPHER_SUITE[cipher]}'
+            f' ( id={iana_value:04d} )"'
+    for cipher, iana_value in CIPHER_SUITE_IANA_VALUE.items()}
+_MBEDTLS_SRV_SIG_ALG_CHECK = {
+    sig_alg: f'-s "received signature algorithm: 0x{iana_value:x}"'
+    for sig_alg, iana_value in SIG_ALG_IANA_VALUE.items()}
+_MBEDTLS_SRV_NAMED_GROUP_CHECK = {
+    named_group: f'-s "got named group: {named_group}({iana_value:04x})"'
+    for named_group, iana_value in NAMED_GROUP_IANA_VALUE.items()}
+_MBEDTLS_SRV_HRR_GROUP_CHECK = {
+    named_group: f'-s "HRR selected_group: {named_group}"'
+    for named_group in NAMED_GROUP_IANA_VALUE}
+_MBEDTLS_CLI_CIPHER_CHECK = {
+    cipher: f'-c "server hello, chosen ciphersuite: ( {iana_value:04x} )'
+            f' - {MbedTLSBase.CIPHER_SUITE[cipher]}"'
+    for cipher, iana_value in CIPHER_SUITE_IANA_VALUE.items()}
+_MBEDTLS_CLI_SIG_ALG_CHECK = {
+    sig_alg: f'-c "Certificate Verify: Signature algorithm ( {iana_value:04x} )"'
+    for sig_alg, iana_value in SIG_ALG_IANA_VALUE.items()}
+_MBEDTLS_CLI_NAMED_GROUP_CHECK = {
+    named_group: f'-c "NamedGroup: {named_group} ( {iana_value:x} )"'
+    for named_group, iana_value in NAMED_GROUP_IANA_VALUE.items()}
+_MBEDTLS_CLI_HRR_GROUP_CHECK = {
+    named_group: f'-c "selected_group ( {iana_value:d} )"'
+    for named_group, iana_value in NAMED_GROUP_IANA_VALUE.items()}
 
 
 class MbedTLSServ(MbedTLSBase):
@@ -373,42 +484,37 @@ class MbedTLSServ(MbedTLSBase):
     Generate test commands for mbedTLS server.
     """
 
+    @_memoize
     def cmd(self):
-        ret = super().cmd()
-        ret += ['tls13_kex_modes=ephemeral cookies=0 tickets=0']
+        ret = list(super().cmd())
+        ret.append('tls13_kex_modes=ephemeral cookies=0 tickets=0')
         return ret
 
     def pre_checks(self):
-        return ['requires_config_enabled MBEDTLS_SSL_SRV_C'] + super().pre_checks()
+        return ('requires_config_enabled MBEDTLS_SSL_SRV_C',) + super().pre_checks()
 
+    @_memoize
     def post_checks(self):
-        check_strings = ["Protocol is TLSv1.3"]
+        ret = ['-s "Protocol is TLSv1.3"']
         if self._ciphers:
-            check_strings.append(
-                "server hello, chosen ciphersuite: {} ( id={:04d} )".format(
-                    self.CIPHER_SUITE[self._ciphers[0]],
-                    CIPHER_SUITE_IANA_VALUE[self._ciphers[0]]))
+            ret.append(_MBEDTLS_SRV_CIPHER_CHECK[self._ciphers[0]])
         if self._sig_algs:
-            check_strings.append(
-                "received signature algorithm: 0x{:x}".format(
-                    SIG_ALG_IANA_VALUE[self._sig_algs[0]]))
+            ret.append(_MBEDTLS_SRV_SIG_ALG_CHECK[self._sig_algs[0]])
 
-        for named_group in self._named_groups:
-            check_strings += ['got named group: {named_group}({iana_value:04x})'.format(
-                                named_group=named_group,
-                                iana_value=NAMED_GROUP_IANA_VALUE[named_group])]
+        ret += [_MBEDTLS_SRV_NAMED_GROUP_CHECK[named_group]
+                for named_group in self._named_groups]
 
-        check_strings.append("Certificate verification was skipped")
-        return ['-s "{}"'.format(i) for i in check_strings]
+        ret.append('-s "Certificate verification was skipped"')
+        return ret
 
     def pre_cmd(self):
         ret = ['$P_SRV']
-        for _, cert, key in map(lambda sig_alg: CERTIFICATES[sig_alg], self._cert_sig_algs):
-            ret += ['crt_file={cert} key_file={key}'.format(cert=cert, key=key)]
+        ret += [_MBEDTLS_CERT_FRAG[sig_alg] for sig_alg in self._cert_sig_algs]
         return ret
 
+    @_memoize
     def hrr_post_checks(self, named_group):
-        return ['-s "HRR selected_group: {:s}"'.format(named_group)]
+        return [_MBEDTLS_SRV_HRR_GROUP_CHECK[named_group]]
 
 
 class MbedTLSCli(MbedTLSBase):
@@ -418,67 +524,103 @@ class MbedTLSCli(MbedTLSBase):
 
     def pre_cmd(self):
         return ['$P_CLI',
-                'ca_file={cafile}'.format(cafile=CERTIFICATES[self._cert_sig_algs[0]].cafile)]
+                _MBEDTLS_CAFILE_FRAG[self._cert_sig_algs[0]]]
 
     def pre_checks(self):
-        return ['requires_config_enabled MBEDTLS_SSL_CLI_C'] + super().pre_checks()
+        return ('requires_config_enabled MBEDTLS_SSL_CLI_C',) + super().pre_checks()
 
+    @_memoize
     def hrr_post_checks(self, named_group):
         ret = ['-c "received HelloRetryRequest message"']
-        ret += ['-c "selected_group ( {:d} )"'.format(NAMED_GROUP_IANA_VALUE[named_group])]
+        ret.append(_MBEDTLS_CLI_HRR_GROUP_CHECK[named_group])
         return ret
 
+    @_memoize
     def post_checks(self):
-        check_strings = ["Protocol is TLSv1.3"]
+        ret = ['-c "Protocol is TLSv1.3"']
         if self._ciphers:
-            check_strings.append(
-                "server hello, chosen ciphersuite: ( {:04x} ) - {}".format(
-                    CIPHER_SUITE_IANA_VALUE[self._ciphers[0]],
-                    self.CIPHER_SUITE[self._ciphers[0]]))
+            ret.append(_MBEDTLS_CLI_CIPHER_CHECK[self._ciphers[0]])
         if self._sig_algs:
-            check_strings.append(
-                "Certificate Verify: Signature algorithm ( {:04x} )".format(
-                    SIG_ALG_IANA_VALUE[self._sig_algs[0]]))
+            ret.append(_MBEDTLS_CLI_SIG_ALG_CHECK[self._sig_algs[0]])
 
-        for named_group in self._named_groups:
-            check_strings += ['NamedGroup: {named_group} ( {iana_value:x} )'.format(
-                                named_group=named_group,
-                                iana_value=NAMED_GROUP_IANA_VALUE[named_group])]
+        ret += [_MBEDTLS_CLI_NAMED_GROUP_CHECK[named_group]
+                for named_group in self._named_groups]
 
-        check_strings.append("Verifying peer X.509 certificate... ok")
-        return ['-c "{}"'.format(i) for i in check_strings]
+        ret.append('-c "Verifying peer X.509 certificate... ok"')
+        return ret
 
 
 SERVER_CLASSES = {'OpenSSL': OpenSSLServ, 'GnuTLS': GnuTLSServ, 'mbedTLS': MbedTLSServ}
 CLIENT_CLASSES = {'OpenSSL': OpenSSLCli, 'GnuTLS': GnuTLSCli, 'mbedTLS': MbedTLSCli}
 
+# Parameters iterated over when generating all test cases
+_CIPHERS = tuple(CIPHER_SUITE_IANA_VALUE)
+_SIG_ALGS = tuple(SIG_ALG_IANA_VALUE)
+_NAMED_GROUPS = tuple(NAMED_GROUP_IANA_VALUE)
+_SERVERS = tuple(SERVER_CLASSES)
+_CLIENTS = tuple(CLIENT_CLASSES)
+
+# Separator between the arguments of `run_test`
+_CMD_PREFIX = ' \\\n' + (' '*9)
+
+
+@functools.lru_cache(maxsize=None)
+def get_program(program_class, ciphersuite=None, signature_algorithm=None,
+                named_groups=(), cert_sig_alg=None):
+    """
+    Return a fully configured program object for the given configuration.
+
+    A single object is shared by all the test cases that use the same
+    configuration. Callers must not modify it, e.g. with the add_* methods,
+    since that would change the other test cases too.
+    """
+    program = program_class(ciphersuite=ciphersuite,
+                            signature_algorithm=signature_algorithm,
+                            cert_sig_alg=cert_sig_alg)
+    program.add_named_groups(*named_groups)
+    # Apply the defaults now so that later calls do not modify the object
+    program.apply_defaults()
+    return program
+
+
+def get_pre_checks(server_object, client_object):
+    """
+    Return the requirements of a test case, without duplicates.
+
+    `requires_*` only apply to the next `run_test` in `ssl-opt.sh`, so they
+    cannot be shared between test cases, but the server and the client of a
+    test case may have requirements in common.
+    """
+    return tuple(dict.fromkeys(server_object.pre_checks() + client_object.pre_checks()))
+
 
 def generate_compat_test(client=None, server=None, cipher=None, named_group=None, sig_alg=None):
     """
     Generate test case with `ssl-opt.sh` format.
     """
-    name = 'TLS 1.3 {client[0]}->{server[0]}: {cipher},{named_group},{sig_alg}'.format(
-        client=client, server=server, cipher=cipher[4:], sig_alg=sig_alg, named_group=named_group)
-
-    server_object = SERVER_CLASSES[server](ciphersuite=cipher,
-                                           named_group=named_group,
-                                           signature_algorithm=sig_alg,
-                                           cert_sig_alg=sig_alg)
-    client_object = CLIENT_CLASSES[client](ciphersuite=cipher,
-                                           named_group=named_group,
-                                           signature_algorithm=sig_alg,
-                                           cert_sig_alg=sig_alg)
-
-    cmd = ['run_test "{}"'.format(name),
-           '"{}"'.format(' '.join(server_object.cmd())),
-           '"{}"'.format(' '.join(client_object.cmd())),
-           '0']
-    cmd += server_object.post_checks()
-    cmd += client_object.post_checks()
-    cmd += ['-C "received HelloRetryRequest message"']
-    prefix = ' \\\n' + (' '*9)
-    cmd = prefix.join(cmd)
-    return '\n'.join(server_object.pre_checks() + client_object.pre_checks() + [cmd])
+    name = f'TLS 1.3 {client[0]}->{server[0]}: {cipher[4:]},{named_group},{sig_alg}'
+
+    server_object = get_program(SERVER_CLASSES[server],
+                                ciphersuite=cipher,
+                                named_groups=(named_group,),
+                                signature_algorithm=sig_alg,
+                                cert_sig_alg=sig_alg)
+    client_object = get_program(CLIENT_CLASSES[client],
+                                ciphersuite=cipher,
+                                named_groups=(named_group,),
+                                signature_algorithm=sig_alg,
+                                cert_sig_alg=sig_alg)
+
+    server_cmd = ' '.join(server_object.cmd())
+    client_cmd = ' '.join(client_object.cmd())
+    cmd = _CMD_PREFIX.join([f'run_test "{name}"',
+                            f'"{server_cmd}"',
+                            f'"{client_cmd}"',
+                            '0',
+                            *server_object.post_checks(),
+                            *client_object.post_checks(),
+                            '-C "received HelloRetryRequest message"'])
+    return '\n'.join([*get_pre_checks(server_object, client_object), cmd])
 
 
 def generate_hrr_compat_test(client=None, server=None,
@@ -487,29 +629,89 @@ def generate_hrr_compat_test(client=None, server=None,
     """
     Generate Hello Retry Request test case with `ssl-opt.sh` format.
     """
-    name = 'TLS 1.3 {client[0]}->{server[0]}: HRR {c_named_group} -> {s_named_group}'.format(
-        client=client, server=server, c_named_group=client_named_group,
-        s_named_group=server_named_group)
-    server_object = SERVER_CLASSES[server](named_group=server_named_group,
-                                           cert_sig_alg=cert_sig_alg)
-
-    client_object = CLIENT_CLASSES[client](named_group=client_named_group,
-                                           cert_sig_alg=cert_sig_alg)
-    client_object.add_named_groups(server_named_group)
-
-    cmd = ['run_test "{}"'.format(name),
-           '"{}"'.format(' '.join(server_object.cmd())),
-           '"{}"'.format(' '.join(client_object.cmd())),
-           '0']
-    cmd += server_object.post_checks()
-    cmd += client_object.post_checks()
-    cmd += server_object.hrr_post_checks(server_named_group)
-    cmd += client_object.hrr_post_checks(server_named_group)
-    prefix = ' \\\n' + (' '*9)
-    cmd = prefix.join(cmd)
-    return '\n'.join(server_object.pre_checks() +
-                     client_object.pre_checks() +
-                     [cmd])
+    name = f'TLS 1.3 {client[0]}->{server[0]}: HRR {client_named_group} -> {server_named_group}'
+    server_object = get_program(SERVER_CLASSES[server],
+                                named_groups=(server_named_group,),
+                                cert_sig_alg=cert_sig_alg)
+    client_object = get_program(CLIENT_CLASSES[client],
+                                named_groups=(client_named_group, server_named_group),
+                                cert_sig_alg=cert_sig_alg)
+
+    server_cmd = ' '.join(server_object.cmd())
+    client_cmd = ' '.join(client_object.cmd())
+    cmd = _CMD_PREFIX.join([f'run_test "{name}"',
+                            f'"{server_cmd}"',
+                            f'"{client_cmd}"',
+                            '0',
+                            *server_object.post_checks(),
+                            *client_object.post_checks(),
+                            *server_object.hrr_post_checks(server_named_group),
+                            *client_object.hrr_post_checks(server_named_group)])
+    return '\n'.join([*get_pre_checks(server_object, client_object), cmd])
+
+def get_all_test_case_params():
+    """
+    Yield the generator function and its keyword arguments for each test case.
+    """
+    # Only pairs involving mbedTLS are tested
+    programs = [(client, server) for client, server in itertools.product(_CLIENTS, _SERVERS)
+                if server == 'mbedTLS' or client == 'mbedTLS']
+
+    # Generate normal compat test cases
+    for client, server in programs:
+        for cipher, named_group, sig_alg in \
+            itertools.product(_CIPHERS, _NAMED_GROUPS, _SIG_ALGS):
+            yield generate_compat_test, dict(client=client, server=server,
+                                             cipher=cipher, named_group=named_group,
+                                             sig_alg=sig_alg)
+
+
+    # Generate Hello Retry Request  compat test cases
+    for client, server in programs:
+        # permutations() only yields pairs of distinct named groups
+        for client_named_group, server_named_group in \
+            itertools.permutations(_NAMED_GROUPS, 2):
+            yield generate_hrr_compat_test, dict(client=client, server=server,
+                                                 client_named_group=client_named_group,
+                                                 server_named_group=server_named_group,
+                                                 cert_sig_alg="ecdsa_secp256r1_sha256")
+
+
+def _generate_test_case(params):
+    generator, kwargs = params
+    return generator(**kwargs)
+
+
+def get_all_test_cases(jobs=1):
+    """
+    Generate all compat test cases, in order.
+
+    With `jobs` greater than 1, the test cases are generated by that many
+    worker processes.
+    """
+    if jobs <= 1:
+        yield from map(_generate_test_case, get_all_test_case_params())
+        return
+    # Imported here because loading it costs more than a serial run saves,
+    # so only pay for it when a process pool is used
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Executor.map() returns the results in submission order
+        yield from executor.map(_generate_test_case, get_all_test_case_params(),
+                                chunksize=64)
+
+def write_test_cases(out, test_cases):
+    """
+    Write test cases separated by blank lines to the text stream `out`.
+
+    The test cases are written as they are generated rather than joined in
+    memory first.
+    """
+    # Drop the separator before the first test case
+    out.writelines(itertools.islice(
+        itertools.chain.from_iterable(('\n\n', test_case) for test_case in test_cases),
+        1, None))
+    out.write('\n')
 
 SSL_OUTPUT_HEADER = '''#!/bin/sh
 
@@ -552,6 +754,10 @@ def main():
     parser.add_argument('-a', '--generate-all-tls13-compat-tests', action='store_true',
                         default=False, help='Generate all available tls13 compat tests')
 
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of processes generating test cases if `-a` was set'
+                             ' (default: 1, 0 for one per CPU)')
+
     parser.add_argument('--list-ciphers', action='store_true',
                         default=False, help='List supported ciphersuites')
 
@@ -585,43 +791,18 @@ def main():
 
     args = parser.parse_args()
 
-    def get_all_test_cases():
-        # Generate normal compat test cases
-        for client, server, cipher, named_group, sig_alg in \
-            itertools.product(CLIENT_CLASSES.keys(),
-                              SERVER_CLASSES.keys(),
-                              CIPHER_SUITE_IANA_VALUE.keys(),
-                              NAMED_GROUP_IANA_VALUE.keys(),
-                              SIG_ALG_IANA_VALUE.keys()):
-            if server == 'mbedTLS' or client == 'mbedTLS':
-                yield generate_compat_test(client=client, server=server,
-                                           cipher=cipher, named_group=named_group,
-                                           sig_alg=sig_alg)
-
-
-        # Generate Hello Retry Request  compat test cases
-        for client, server, client_named_group, server_named_group in \
-            itertools.product(CLIENT_CLASSES.keys(),
-                              SERVER_CLASSES.keys(),
-                              NAMED_GROUP_IANA_VALUE.keys(),
-                              NAMED_GROUP_IANA_VALUE.keys()):
-
-            if (client == 'mbedTLS' or server == 'mbedTLS') and \
-                client_named_group != server_named_group:
-                yield generate_hrr_compat_test(client=client, server=server,
-                                               client_named_group=client_named_group,
-                                               server_named_group=server_named_group,
-                                               cert_sig_alg="ecdsa_secp256r1_sha256")
+    if args.jobs < 0:
+        parser.error('argument -j/--jobs: must not be negative')
 
     if args.generate_all_tls13_compat_tests:
+        jobs = args.jobs or os.cpu_count() or 1
         if args.output:
-            with open(args.output, 'w', encoding="utf-8") as f:
+            with open(args.output, 'w', encoding="utf-8", buffering=1 << 20) as f:
                 f.write(SSL_OUTPUT_HEADER.format(
                     filename=os.path.basename(args.output), cmd=' '.join(sys.argv)))
-                f.write('\n\n'.join(get_all_test_cases()))
-                f.write('\n')
+                write_test_cases(f, get_all_test_cases(jobs))
         else:
-            print('\n\n'.join(get_all_test_cases()))
+            write_test_cases(sys.stdout, get_all_test_cases(jobs))
         return 0
 
     if args.list_ciphers or args.list_sig_algs or args.list_named_groups \